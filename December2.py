@@ -4,6 +4,28 @@ Santa's magical workshop clock shows x hours and y minutes.
 Calculates how many minutes and seconds have passed since midnight.
 """
 
+import mmap
+import os
+from array import array
+
+
+# Precomputed minutes since midnight for every (hour, minute) pair
+MINUTE_TABLE = {}
+# Precomputed minutes since midnight for every "HH:MM" (and "H:MM") reading
+CLOCK_TABLE = {}
+for _hour in range(24):
+    for _minute in range(60):
+        MINUTE_TABLE[(_hour, _minute)] = _hour * 60 + _minute
+        CLOCK_TABLE[f"{_hour:02d}:{_minute:02d}"] = _hour * 60 + _minute
+        CLOCK_TABLE[f"{_hour}:{_minute:02d}"] = _hour * 60 + _minute
+del _hour, _minute
+
+# Same table keyed by raw bytes, for decoding log files without str conversion
+CLOCK_BYTES_TABLE = {reading.encode("ascii"): value for reading, value in CLOCK_TABLE.items()}
+
+# Bytes of log data decoded per batch
+LOG_CHUNK_BYTES = 1 << 22
+
 
 def calculate_time_passed(hours, minutes):
     """
@@ -39,6 +61,162 @@ def calculate_time_passed(hours, minutes):
     return m, s
 
 
+def calculate_times_passed(hours, minutes):
+    """
+    Calculate minutes and seconds passed since midnight for many readings.
+    
+    Each (hour, minute) pair is looked up in MINUTE_TABLE instead of being
+    range-checked one by one. Out-of-range or non-integer readings (the ones
+    calculate_time_passed rejects) do not raise; they get 0 minutes and
+    0 seconds and are flagged with 0 in the validity mask.
+    
+    Args:
+        hours: Sequence of hours on the clock (0-23)
+        minutes: Sequence of minutes on the clock (0-59)
+    
+    Returns:
+        Tuple of (minutes_passed, seconds_passed, valid) where the first two
+        are array('l') and valid is a bytearray with 1 for valid readings
+    
+    Raises:
+        ValueError: If the input sequences have different lengths
+    """
+    if len(hours) != len(minutes):
+        raise ValueError("Hours and minutes must have the same length")
+    
+    # Out-of-range pairs miss the table and map to None; the type check keeps
+    # floats such as 1.0 (equal to 1) and unhashable values out of the lookup
+    table_get = MINUTE_TABLE.get
+    minutes_of_day = [
+        table_get((h, m)) if isinstance(h, int) and isinstance(m, int) else None
+        for h, m in zip(hours, minutes)
+    ]
+    return _split_minutes(minutes_of_day)
+
+
+def calculate_times_passed_from_strings(readings):
+    """
+    Calculate minutes and seconds passed since midnight for "HH:MM" strings.
+    
+    Each reading is looked up in CLOCK_TABLE, so no per-item parsing or
+    validation is done. Readings that are not valid clock times are flagged
+    with 0 in the validity mask.
+    
+    Args:
+        readings: Iterable of "HH:MM" (or "H:MM") strings
+    
+    Returns:
+        Tuple of (minutes_passed, seconds_passed, valid) as in
+        calculate_times_passed
+    """
+    table_get = CLOCK_TABLE.get
+    return _split_minutes([table_get(reading) if isinstance(reading, str) else None for reading in readings])
+
+
+def _split_minutes(minutes_of_day):
+    """Build the minutes, seconds and validity arrays from table lookups (None = invalid)."""
+    valid = bytearray(m is not None for m in minutes_of_day)
+    minutes_passed = array('l', [m or 0 for m in minutes_of_day])
+    seconds_passed = array('l', [m * 60 for m in minutes_passed])
+    return minutes_passed, seconds_passed, valid
+
+
+def _iter_stream_chunks(stream, chunk_bytes):
+    """Read a binary stream in chunks that always end on a line boundary."""
+    tail = b""
+    while True:
+        data = stream.read(chunk_bytes)
+        if not data:
+            break
+        data = tail + data
+        newline = data.rfind(b"\n")
+        if newline < 0:
+            tail = data
+            continue
+        tail = data[newline + 1:]
+        yield data[:newline + 1]
+    if tail:
+        yield tail
+
+
+def _iter_line_chunks(source, chunk_bytes):
+    """
+    Yield byte chunks of whole lines from a path or a binary stream.
+    
+    Paths are memory-mapped when possible; empty files and files that cannot
+    be mapped (pipes, devices) fall back to buffered reads.
+    """
+    if not isinstance(source, (str, bytes, os.PathLike)):
+        yield from _iter_stream_chunks(source, chunk_bytes)
+        return
+    
+    with open(source, "rb") as stream:
+        try:
+            buffer = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            yield from _iter_stream_chunks(stream, chunk_bytes)
+            return
+        
+        with buffer:
+            size = len(buffer)
+            start = 0
+            while start < size:
+                end = min(start + chunk_bytes, size)
+                if end < size:
+                    # Cut at the last newline in the window, or the first one after it
+                    newline = buffer.rfind(b"\n", start, end)
+                    if newline < 0:
+                        newline = buffer.find(b"\n", end)
+                    end = newline + 1 if newline >= 0 else size
+                yield buffer[start:end]
+                start = end
+
+
+def parse_clock_log(source, chunk_bytes=LOG_CHUNK_BYTES):
+    """
+    Parse a log of "HH:MM" clock readings into minutes since midnight.
+    
+    The log is read in bytes mode (memory-mapped for regular files) and every
+    line is decoded with a single CLOCK_BYTES_TABLE lookup. Surrounding
+    whitespace and Windows line endings are tolerated; blank lines are skipped.
+    
+    Args:
+        source: Path of the log file, or a binary stream such as sys.stdin.buffer
+        chunk_bytes: Approximate number of bytes decoded per batch
+    
+    Yields:
+        Tuples of (minutes, malformed) per batch, where minutes is an
+        array('l') of minutes since midnight for the valid lines and
+        malformed is a list of (line_number, raw_line) for the rest
+    """
+    table_get = CLOCK_BYTES_TABLE.get
+    line_number = 0
+    
+    for chunk in _iter_line_chunks(source, chunk_bytes):
+        lines = chunk.split(b"\n")
+        if lines[-1] == b"":
+            lines.pop()
+        
+        values = list(map(table_get, lines))
+        malformed = []
+        
+        # Slow path only for batches that contain lines the table did not match
+        if None in values:
+            for i, value in enumerate(values):
+                if value is not None:
+                    continue
+                stripped = lines[i].strip()
+                value = table_get(stripped)
+                if value is not None:
+                    values[i] = value
+                elif stripped:
+                    malformed.append((line_number + i + 1, lines[i]))
+            values = [value for value in values if value is not None]
+        
+        line_number += len(lines)
+        yield array('l', values), malformed
+
+
 def main():
     """Main function to handle user input and display results."""
     try:
@@ -1,3 +1,45 @@
+import json
+import math
+import sys
+from array import array
+from itertools import repeat
+from operator import add, floordiv, mul
+
+
+# Per-row error codes returned by the batch calculators
+TILE_OK = 0
+TILE_TYPE_ERROR = 1
+TILE_VALUE_ERROR = 2
+TILE_MISSING_EXTRA = 3
+TILE_EXTRA_RANGE = 4
+TILE_NOT_FINITE = 5
+TILE_OVERFLOW = 6
+
+# Fixed-point scales: millimetres, cents and basis points
+LENGTH_SCALE = 1000
+PRICE_SCALE = 100
+EXTRA_SCALE = 10000
+
+# Divisor taking mm * mm * basis points * cents back to cents
+CENTS_DENOMINATOR = LENGTH_SCALE * LENGTH_SCALE * EXTRA_SCALE
+
+# Bytes of input read per chunk by the streaming pipeline
+STREAM_CHUNK_BYTES = 1 << 20
+
+# Field order of streamed room records
+RECORD_FIELDS = ("length", "width", "m2price", "extra_percentage")
+
+# Exceptions raised by the scalar fixed-point calculator for each error code
+_TILE_ERRORS = {
+    TILE_TYPE_ERROR: (TypeError, "All parameters must be numeric (int or float)"),
+    TILE_VALUE_ERROR: (ValueError, "Length, width, and price must be positive numbers"),
+    TILE_MISSING_EXTRA: (ValueError, "Extra percentage must be provided"),
+    TILE_EXTRA_RANGE: (ValueError, "Extra percentage must be between 0 and 1 (0-100%)"),
+    TILE_NOT_FINITE: (ValueError, "All parameters must be finite numbers"),
+    TILE_OVERFLOW: (ValueError, "Parameters are too large to price in cents"),
+}
+
+
 def calculate_tile_cost(length, width, m2price, extra_percentage=None):
     """
     Calculate the total cost of tiles for Santa's room renovation.
@@ -40,6 +82,534 @@ def calculate_tile_cost(length, width, m2price, extra_percentage=None):
     return round(total_cost, 2)
 
 
+def _tile_error_code(length, width, m2price, extra_percentage):
+    """
+    Validate one room the same way calculate_tile_cost does.
+    
+    Returns:
+        TILE_OK for a valid room, otherwise one of the TILE_* error codes
+    """
+    numeric = (int, float)
+    if not isinstance(length, numeric) or not isinstance(width, numeric) or not isinstance(m2price, numeric):
+        return TILE_TYPE_ERROR
+    
+    if length <= 0 or width <= 0 or m2price <= 0:
+        return TILE_VALUE_ERROR
+    
+    if extra_percentage is None:
+        return TILE_MISSING_EXTRA
+    
+    if not isinstance(extra_percentage, numeric):
+        return TILE_TYPE_ERROR
+    
+    if extra_percentage < 0 or extra_percentage > 1:
+        return TILE_EXTRA_RANGE
+    
+    return TILE_OK
+
+
+def _columns_valid(lengths, widths, m2prices, extra_percentages):
+    """
+    Check whole columns at once against the rules of _tile_error_code.
+    
+    Returns:
+        True if every row is valid; False if rows must be checked one by one
+    """
+    # Exact types only; subclasses of int and float are left to the per-row isinstance checks
+    numeric = {int, float, bool}
+    for column in (lengths, widths, m2prices, extra_percentages):
+        if not set(map(type, column)) <= numeric:
+            return False
+    
+    # min() and max() skip a NaN that is not first, so a NaN can pass these bounds.
+    # That matches _tile_error_code, which accepts NaN as well; the cents engine
+    # rejects non-finite values separately
+    return (min(lengths) > 0 and min(widths) > 0 and min(m2prices) > 0
+            and min(extra_percentages) >= 0 and max(extra_percentages) <= 1)
+
+
+def calculate_tile_costs(lengths, widths, m2prices, extra_percentages):
+    """
+    Calculate tile costs for many rooms in a single pass.
+    
+    Takes columnar inputs (one sequence per parameter) and gives exactly the
+    same cost as calculate_tile_cost for every valid row. Columns are
+    validated in bulk and priced with map() over operator functions; only a
+    batch containing invalid rows falls back to checking row by row. Invalid
+    rows do not abort the batch: they get cost 0.0 and a non-zero error code.
+    
+    Args:
+        lengths: Sequence of room lengths in meters
+        widths: Sequence of room widths in meters
+        m2prices: Sequence of prices per square meter in coins
+        extra_percentages: Sequence of extra percentages for losses (0-1)
+    
+    Returns:
+        Tuple of (costs, error_codes) where costs is an array('d') and
+        error_codes is an array('b') holding TILE_OK or a TILE_* error code
+    
+    Raises:
+        ValueError: If the input columns have different lengths
+    """
+    size = len(lengths)
+    if len(widths) != size or len(m2prices) != size or len(extra_percentages) != size:
+        raise ValueError("All input columns must have the same length")
+    
+    error_codes = array('b', bytes(size))
+    
+    if size and _columns_valid(lengths, widths, m2prices, extra_percentages):
+        # Same operation order as calculate_tile_cost so results are identical
+        areas = map(mul, lengths, widths)
+        areas_with_extra = map(mul, areas, map(add, repeat(1), extra_percentages))
+        totals = map(mul, areas_with_extra, m2prices)
+        return array('d', map(round, totals, repeat(2))), error_codes
+    
+    costs = array('d', bytes(8 * size))
+    
+    # Bind locals once, the loop body runs for every room in the batch
+    check = _tile_error_code
+    for i, (length, width, m2price, extra) in enumerate(zip(lengths, widths, m2prices, extra_percentages)):
+        code = check(length, width, m2price, extra)
+        if code:
+            error_codes[i] = code
+            continue
+        # Same operation order as calculate_tile_cost so results are identical
+        costs[i] = round(length * width * (1 + extra) * m2price, 2)
+    
+    return costs, error_codes
+
+
+def _is_finite(value):
+    """Return True unless value is an infinite or NaN float (ints are always finite)."""
+    return isinstance(value, int) or math.isfinite(value)
+
+
+def _cents_error_code(length, width, m2price, extra_percentage):
+    """
+    Validate one room for the fixed-point engine.
+    
+    Same rules as _tile_error_code, plus infinite and NaN values, which
+    have no integer-cents representation, are rejected.
+    """
+    code = _tile_error_code(length, width, m2price, extra_percentage)
+    if code:
+        return code
+    
+    if not (_is_finite(length) and _is_finite(width) and _is_finite(m2price) and _is_finite(extra_percentage)):
+        return TILE_NOT_FINITE
+    
+    return TILE_OK
+
+
+def _cost_in_cents(length, width, m2price, extra_percentage):
+    """
+    Price one already validated room in integer cents.
+    
+    Every input is scaled to an integer first (millimetres, cents, basis
+    points), the product is computed exactly and divided back to cents with
+    round-half-up, so the result never depends on float rounding.
+    """
+    length_mm = round(length * LENGTH_SCALE)
+    width_mm = round(width * LENGTH_SCALE)
+    price_cents = round(m2price * PRICE_SCALE)
+    extra_bp = round(extra_percentage * EXTRA_SCALE)
+    
+    numerator = length_mm * width_mm * (EXTRA_SCALE + extra_bp) * price_cents
+    
+    return (numerator + CENTS_DENOMINATOR // 2) // CENTS_DENOMINATOR
+
+
+def calculate_tile_cost_cents(length, width, m2price, extra_percentage=None):
+    """
+    Calculate the total cost of tiles in integer cents (fixed-point mode).
+    
+    Lengths are taken to the millimetre, the price to the cent and the extra
+    percentage to the basis point. The cost is rounded half-up to the cent,
+    so totals can be summed exactly with plain integer addition.
+    
+    Args:
+        length: Room length in meters (float or int)
+        width: Room width in meters (float or int)
+        m2price: Price per square meter in coins (float or int)
+        extra_percentage: Extra percentage for losses (0-1)
+    
+    Returns:
+        Total cost including extra percentage for losses, in cents (int)
+    
+    Raises:
+        ValueError: If any parameter is negative, zero, not finite or too
+            large to scale to whole units
+        TypeError: If parameters are not numeric
+    """
+    code = _cents_error_code(length, width, m2price, extra_percentage)
+    if not code:
+        # Scaling a huge finite float can overflow to inf, which round() rejects
+        try:
+            return _cost_in_cents(length, width, m2price, extra_percentage)
+        except OverflowError:
+            code = TILE_OVERFLOW
+    
+    error_type, message = _TILE_ERRORS[code]
+    raise error_type(message)
+
+
+def _scale_column(column, scale):
+    """Lazily scale a validated numeric column and round each value to an int."""
+    # float.__round__ skips round()'s type dispatch when the column is all floats
+    rounder = float.__round__ if set(map(type, column)) == {float} else round
+    return map(rounder, map(mul, column, repeat(scale)))
+
+
+def calculate_tile_costs_cents(lengths, widths, m2prices, extra_percentages):
+    """
+    Calculate tile costs in integer cents for many rooms in a single pass.
+    
+    Fixed-point counterpart of calculate_tile_costs, using the same rounding
+    rules as calculate_tile_cost_cents. Valid batches are priced in bulk with
+    map(); otherwise rows are checked one by one. Infinite or NaN inputs get
+    TILE_NOT_FINITE, and costs too large for a 64-bit cent count get
+    TILE_OVERFLOW, instead of aborting the batch.
+    
+    Args:
+        lengths: Sequence of room lengths in meters
+        widths: Sequence of room widths in meters
+        m2prices: Sequence of prices per square meter in coins
+        extra_percentages: Sequence of extra percentages for losses (0-1)
+    
+    Returns:
+        Tuple of (costs, error_codes) where costs is an array('q') of cents
+        and error_codes is an array('b') holding TILE_OK or a TILE_* error code
+    
+    Raises:
+        ValueError: If the input columns have different lengths
+    """
+    size = len(lengths)
+    if len(widths) != size or len(m2prices) != size or len(extra_percentages) != size:
+        raise ValueError("All input columns must have the same length")
+    
+    error_codes = array('b', bytes(size))
+    columns = (lengths, widths, m2prices, extra_percentages)
+    half = CENTS_DENOMINATOR // 2
+    
+    if size and _columns_valid(*columns):
+        # Huge ints in isfinite or cents beyond 64 bits land on the per-row path
+        try:
+            if all(all(map(math.isfinite, column)) for column in columns):
+                lengths_mm = _scale_column(lengths, LENGTH_SCALE)
+                widths_mm = _scale_column(widths, LENGTH_SCALE)
+                extra_factors = map(add, repeat(EXTRA_SCALE), _scale_column(extra_percentages, EXTRA_SCALE))
+                prices_cents = _scale_column(m2prices, PRICE_SCALE)
+                numerators = map(mul, map(mul, map(mul, lengths_mm, widths_mm), extra_factors), prices_cents)
+                costs = array('q', map(floordiv, map(add, numerators, repeat(half)), repeat(CENTS_DENOMINATOR)))
+                return costs, error_codes
+        except OverflowError:
+            pass
+    
+    costs = array('q', bytes(8 * size))
+    check = _cents_error_code
+    for i, (length, width, m2price, extra) in enumerate(zip(*columns)):
+        code = check(length, width, m2price, extra)
+        if code:
+            error_codes[i] = code
+            continue
+        # Scaling can overflow to inf and the cents can exceed 64 bits
+        try:
+            numerator = (round(length * LENGTH_SCALE) * round(width * LENGTH_SCALE)
+                         * (EXTRA_SCALE + round(extra * EXTRA_SCALE)) * round(m2price * PRICE_SCALE))
+            costs[i] = (numerator + half) // CENTS_DENOMINATOR
+        except OverflowError:
+            error_codes[i] = TILE_OVERFLOW
+    
+    return costs, error_codes
+
+
+def format_cents(cents):
+    """Format an amount in cents as a coin string with two decimals."""
+    sign = "-" if cents < 0 else ""
+    whole, fraction = divmod(abs(cents), PRICE_SCALE)
+    return f"{sign}{whole}.{fraction:02d}"
+
+
+class FloorPlan:
+    """
+    Whole-house tile order made of many rooms.
+    
+    Rooms with identical (length, width, extra_percentage) share one shape.
+    Shape areas are memoized when a shape is first added, and shape costs are
+    cached for the most recent m2price, so pricing the house at a new price
+    costs O(unique shapes) rather than O(rooms).
+    """
+    
+    def __init__(self):
+        """
+        Initialize an empty floor plan.
+        
+        Attributes:
+            rooms (list): (name, shape) pairs in the order rooms were added
+            shape_counts (dict): Number of rooms for each shape
+        """
+        self.rooms = []
+        self.shape_counts = {}
+        self._areas = {}
+        self._cost_price = None
+        self._costs = {}
+    
+    def add_room(self, length, width, extra_percentage, name=None):
+        """
+        Add a room to the floor plan.
+        
+        Args:
+            length: Room length in meters (float or int)
+            width: Room width in meters (float or int)
+            extra_percentage: Extra percentage for losses (0-1)
+            name: Optional room name (defaults to "Room <number>")
+        
+        Returns:
+            Index of the new room
+        
+        Raises:
+            ValueError: If a dimension is not positive or extra is out of range
+            TypeError: If parameters are not numeric
+        """
+        # Price 1 stands in for the m2price, which is only known when pricing
+        code = _tile_error_code(length, width, 1, extra_percentage)
+        if code:
+            error_type, message = _TILE_ERRORS[code]
+            raise error_type(message)
+        
+        if name is None:
+            name = f"Room {len(self.rooms) + 1}"
+        
+        shape = (length, width, extra_percentage)
+        self.rooms.append((name, shape))
+        self.shape_counts[shape] = self.shape_counts.get(shape, 0) + 1
+        if shape not in self._areas:
+            # Same operation order as calculate_tile_cost
+            self._areas[shape] = length * width * (1 + extra_percentage)
+        
+        return len(self.rooms) - 1
+    
+    def shape_area(self, shape):
+        """Return the memoized floor area including extra tiles for a shape."""
+        return self._areas[shape]
+    
+    def shape_costs(self, m2price):
+        """
+        Return the cost of every unique shape at the given price.
+        
+        Costs are the memoized shape area times the price, rounded like
+        calculate_tile_cost. Only the most recent price is cached; repeated
+        calls at that price compute just the shapes added since.
+        
+        Args:
+            m2price: Price per square meter in coins
+        
+        Returns:
+            Dictionary {shape: cost}
+        
+        Raises:
+            ValueError: If the price is not positive
+            TypeError: If the price is not numeric
+        """
+        # Unit dimensions stand in for the room, only the price is checked
+        code = _tile_error_code(1, 1, m2price, 0)
+        if code:
+            error_type, message = _TILE_ERRORS[code]
+            raise error_type(message)
+        
+        if m2price != self._cost_price:
+            self._cost_price = m2price
+            self._costs = {}
+        
+        costs = self._costs
+        if len(costs) != len(self.shape_counts):
+            areas = self._areas
+            for shape in self.shape_counts:
+                if shape not in costs:
+                    costs[shape] = round(areas[shape] * m2price, 2)
+        return costs
+    
+    def room_costs(self, m2price):
+        """
+        Return the cost of every room at the given price.
+        
+        Returns:
+            List of (name, cost) tuples in the order rooms were added
+        """
+        costs = self.shape_costs(m2price)
+        return [(name, costs[shape]) for name, shape in self.rooms]
+    
+    def total_cost(self, m2price):
+        """
+        Return the whole-house cost at the given price.
+        
+        Computed per unique shape as cost times the number of rooms.
+        """
+        costs = self.shape_costs(m2price)
+        total = sum(costs[shape] * count for shape, count in self.shape_counts.items())
+        return round(total, 2)
+
+
+def _parse_field(field):
+    """Parse one CSV field as a float, keeping the raw text if it is not numeric."""
+    field = field.strip()
+    if not field:
+        return None
+    try:
+        return float(field)
+    except ValueError:
+        return field
+
+
+def _csv_records(lines):
+    """Split CSV lines into (raw_line, fields) records, skipping blank lines."""
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            continue
+        yield line, [_parse_field(field) for field in line.split(",")]
+
+
+def _jsonl_records(lines):
+    """
+    Decode JSONL lines into (record, fields) pairs, skipping blank lines.
+    
+    Lines that are not JSON objects become {"raw": line}, so their error
+    rows can still be tied back to the input.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict):
+            yield {"raw": line.rstrip("\r\n")}, [None] * len(RECORD_FIELDS)
+            continue
+        yield record, [record.get(name) for name in RECORD_FIELDS]
+
+
+def _finite_json(value):
+    """Replace infinite and NaN floats in a decoded JSON value with strings such as "inf"."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return repr(value)
+    if isinstance(value, dict):
+        return {key: _finite_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_finite_json(item) for item in value]
+    return value
+
+
+def stream_tile_costs(source, sink, fmt="csv", cents=False, chunk_bytes=STREAM_CHUNK_BYTES):
+    """
+    Price room records from a text stream and write the results incrementally.
+    
+    Records are read in chunks of about chunk_bytes, priced with the batch
+    calculators and written before the next chunk is read, so memory use
+    does not grow with the size of the input.
+    
+    CSV input has one "length,width,m2price,extra_percentage" record per line
+    (a non-numeric header line is skipped) and each output line repeats the
+    record followed by the cost and the error code. JSONL input has one object
+    per line with the same keys; the output objects gain "cost" and "error".
+    Lines that are not JSON objects are echoed under a "raw" key.
+    Rows whose cost is infinite or NaN (from inputs such as 1e999 or a cost
+    that overflows) get cost 0 and TILE_NOT_FINITE in both formats, and
+    non-finite input values are written as strings such as "inf", so the
+    JSONL output is always valid JSON.
+    The extra percentage is a fraction (0.1 for 10%), as in calculate_tile_cost.
+    
+    Args:
+        source: Readable text stream (file or sys.stdin)
+        sink: Writable text stream (file or sys.stdout)
+        fmt: Record format, "csv" or "jsonl"
+        cents: If True, price with the integer-cents fixed-point engine
+        chunk_bytes: Approximate number of bytes read per chunk
+    
+    Returns:
+        Number of records processed
+    
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt == "csv":
+        parse = _csv_records
+    elif fmt == "jsonl":
+        parse = _jsonl_records
+    else:
+        raise ValueError("Format must be 'csv' or 'jsonl'")
+    
+    calculate = calculate_tile_costs_cents if cents else calculate_tile_costs
+    processed = 0
+    first_chunk = True
+    
+    while True:
+        lines = source.readlines(chunk_bytes)
+        if not lines:
+            break
+        
+        records = list(parse(lines))
+        
+        # Skip a CSV header line such as "length,width,m2price,extra_percentage"
+        if first_chunk and fmt == "csv" and records and isinstance(records[0][1][0], str):
+            records.pop(0)
+        first_chunk = False
+        
+        columns = [[], [], [], []]
+        for _, fields in records:
+            if len(fields) != len(RECORD_FIELDS):
+                fields = ["", None, None, None]
+            for column, value in zip(columns, fields):
+                column.append(value)
+        
+        costs, error_codes = calculate(*columns)
+        
+        output = []
+        for (record, _), cost, code in zip(records, costs, error_codes):
+            if not cents and not code and not math.isfinite(cost):
+                cost, code = 0.0, TILE_NOT_FINITE
+            cost_text = format_cents(cost) if cents else str(cost)
+            if fmt == "csv":
+                output.append(f"{record},{cost_text},{code}\n")
+            else:
+                record["cost"] = cost if not cents else cost_text
+                record["error"] = code
+                try:
+                    text = json.dumps(record, allow_nan=False)
+                except ValueError:
+                    text = json.dumps(_finite_json(record))
+                output.append(text + "\n")
+        
+        sink.write("".join(output))
+        processed += len(records)
+    
+    return processed
+
+
+def stream_main(args):
+    """
+    Run the non-interactive streaming mode.
+    
+    Usage: python december1.py stream [csv|jsonl] [input|-] [output|-] [--cents]
+    """
+    cents = "--cents" in args
+    args = [arg for arg in args if arg != "--cents"]
+    fmt = args[0].lower() if len(args) > 0 else "csv"
+    input_path = args[1] if len(args) > 1 else "-"
+    output_path = args[2] if len(args) > 2 else "-"
+    
+    source = sys.stdin if input_path == "-" else open(input_path, "r", newline="", buffering=STREAM_CHUNK_BYTES)
+    sink = sys.stdout if output_path == "-" else open(output_path, "w", newline="", buffering=STREAM_CHUNK_BYTES)
+    try:
+        return stream_tile_costs(source, sink, fmt=fmt, cents=cents)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+
 def main():
     """Main function to demonstrate tile cost calculation."""
     try:
@@ -61,4 +631,8 @@ def main():
 
 # Example usage
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # "stream" argument prices room records from a file or stdin
+    if len(sys.argv) > 1 and sys.argv[1].lower() == "stream":
+        stream_main(sys.argv[2:])
+    else:
+        main()
\ No newline at end of file
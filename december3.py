@@ -6,6 +6,10 @@ Example: 1235 -> 15
 """
 
 
+# Precomputed results for every four-digit number, indexed by number - 1000
+FOUR_DIGIT_TABLE = [(number // 1000) * 10 + number % 10 for number in range(1000, 10000)]
+
+
 def transform_number(number):
     """
     Remove the two middle digits from a four-digit number.
@@ -28,17 +32,99 @@ def transform_number(number):
     if not (1000 <= number <= 9999):
         raise ValueError("Number must be a four-digit number (1000-9999)")
     
-    # Convert to string to access digits
-    number_str = str(number)
+    # First and last digits come from the precomputed table
+    return FOUR_DIGIT_TABLE[number - 1000]
+
+
+def count_digits(number):
+    """
+    Count the decimal digits of a positive integer without converting it to str.
+    
+    Args:
+        number: A positive integer
+    
+    Returns:
+        Number of decimal digits
+    """
+    # bit_length * log10(2) estimates the count to within one digit
+    digits = (number.bit_length() * 1233 >> 12) + 1
+    if number < 10 ** (digits - 1):
+        digits -= 1
+    while number >= 10 ** digits:
+        digits += 1
+    return digits
+
+
+def remove_middle_digits(number, removed=2):
+    """
+    Remove a block of middle digits from a number of any length.
+    
+    The removed block is centred; when the remaining digits cannot be split
+    evenly, the extra digit is kept at the end. Digits are extracted
+    arithmetically, so there is no str/int round-trip.
+    Example: remove_middle_digits(1234567, 3) -> 1267
     
-    # Extract first and last digits
-    first_digit = number_str[0]
-    last_digit = number_str[3]
+    Args:
+        number: A positive integer
+        removed: How many middle digits to remove (at least 0)
+    
+    Returns:
+        The number formed by the remaining first and last digits
     
-    # Create new two-digit number
-    new_number = int(first_digit + last_digit)
+    Raises:
+        ValueError: If the number is not positive or too short for the removal
+        TypeError: If inputs are not integers
+    """
+    # Validate input types
+    if not isinstance(number, int) or not isinstance(removed, int):
+        raise TypeError("Number and removed digit count must be integers")
+    
+    if number <= 0:
+        raise ValueError("Number must be positive")
+    if removed < 0:
+        raise ValueError("Removed digit count must not be negative")
+    
+    digits = count_digits(number)
+    if removed >= digits:
+        raise ValueError(f"Number must have more than {removed} digits")
+    
+    kept_front = (digits - removed) // 2
+    kept_back = digits - removed - kept_front
+    
+    back_scale = 10 ** kept_back
+    front = number // 10 ** (digits - kept_front)
+    back = number % back_scale
+    
+    return front * back_scale + back
+
+
+def transform_numbers(numbers, removed=2):
+    """
+    Remove the middle digits from every number in a sequence.
+    
+    Four-digit numbers with two removed digits (the transform_number case)
+    are answered from FOUR_DIGIT_TABLE; everything else goes through
+    remove_middle_digits.
+    
+    Args:
+        numbers: Iterable of positive integers
+        removed: How many middle digits to remove from each number
+    
+    Returns:
+        List of transformed numbers, in input order
+    
+    Raises:
+        ValueError: If a number is not positive or too short for the removal
+        TypeError: If a number is not an integer
+    """
+    if removed != 2:
+        return [remove_middle_digits(number, removed) for number in numbers]
     
-    return new_number
+    table = FOUR_DIGIT_TABLE
+    return [
+        table[number - 1000] if type(number) is int and 1000 <= number <= 9999 else remove_middle_digits(number, removed)
+        for number in numbers
+    ]
 
 
 def main():
@@ -11,23 +11,112 @@ Total price of magical toys: 28.0 EUR
 Number of magical toys: 2
 """
 
+import math
+import sys
+from bisect import bisect_right, insort
+from itertools import accumulate, islice
 
-def calculate_magical_toys():
+
+# A toy is "magical" if it costs more than this many EUR
+MAGICAL_THRESHOLD = 10
+
+# Prices aggregated per chunk and bytes read per chunk from price feeds
+PRICE_CHUNK_SIZE = 1 << 16
+PRICE_CHUNK_BYTES = 1 << 20
+
+
+def _total(prices):
+    """Sum prices with math.fsum, or with sum() if fsum overflows (the total is then inf)."""
+    try:
+        return math.fsum(prices)
+    except OverflowError:
+        return sum(prices)
+
+
+def aggregate_magical_toys(prices, threshold=MAGICAL_THRESHOLD):
     """
-    Calculate total price and count of toys costing more than 10 EUR.
+    Calculate total price and count of toys costing more than the threshold.
     
-    Reads toy prices from user input until 0 is entered.
-    A toy is "magical" if its price is more than 10 EUR.
+    Pure aggregation core: consumes any iterable of prices in chunks, stops at
+    the first 0 (the end-of-input signal) and ignores negative prices, just
+    like the interactive loop. Totals use compensated summation (math.fsum)
+    so long feeds do not lose precision; a total too large for a float is
+    inf, as with plain addition.
+    
+    Args:
+        prices: Iterable of toy prices (floats)
+        threshold: Price a toy must exceed to be magical
     
     Returns:
         Tuple of (total_price, count) for magical toys
-    
-    Raises:
-        ValueError: If price is negative or invalid input
     """
-    total_price = 0.0
+    chunk_sums = []
     count = 0
+    iterator = iter(prices)
+    
+    while True:
+        chunk = list(islice(iterator, PRICE_CHUNK_SIZE))
+        if not chunk:
+            break
+        
+        finished = 0 in chunk
+        if finished:
+            chunk = chunk[:chunk.index(0)]
+        
+        magical = [price for price in chunk if price > threshold]
+        chunk_sums.append(_total(magical))
+        count += len(magical)
+        
+        if finished:
+            break
+    
+    return _total(chunk_sums), count
+
+
+def read_prices(stream, chunk_bytes=PRICE_CHUNK_BYTES):
+    """
+    Parse toy prices from a text stream in bulk.
     
+    Prices may be separated by whitespace or semicolons. Tokens that are not
+    valid numbers are reported on stderr and skipped.
+    
+    Args:
+        stream: Readable text stream (file or sys.stdin)
+        chunk_bytes: Approximate number of characters read per chunk
+    
+    Yields:
+        Toy prices as floats
+    """
+    tail = ""
+    while True:
+        data = stream.read(chunk_bytes)
+        if not data:
+            break
+        
+        tokens = (tail + data).replace(";", " ").split()
+        # The last token may continue in the next chunk
+        tail = tokens.pop() if tokens and not data[-1].isspace() and data[-1] != ";" else ""
+        yield from _parse_prices(tokens)
+    
+    yield from _parse_prices(tail.split())
+
+
+def _parse_prices(tokens):
+    """Convert price tokens to floats, skipping invalid ones."""
+    try:
+        return list(map(float, tokens))
+    except ValueError:
+        prices = []
+        for token in tokens:
+            try:
+                prices.append(float(token))
+            except ValueError:
+                print(f"Error: '{token}' is not a valid number.", file=sys.stderr)
+        return prices
+
+
+def _prompt_prices():
+    """Read toy prices from user input until 0 is entered."""
     while True:
         try:
             # Get price input from user
@@ -35,33 +124,153 @@ def calculate_magical_toys():
             
             # Check if input is the termination signal
             if price == 0:
-                break
+                return
             
             # Validate that price is not negative
             if price < 0:
                 print("Error: Price cannot be negative. Please enter a valid price.")
                 continue
             
-            # Check if toy is magical (costs more than 10 EUR)
-            if price > 10:
-                total_price += price
-                count += 1
+            yield price
         
         except ValueError:
             print("Error: Please enter a valid number.")
             continue
+
+
+def calculate_magical_toys():
+    """
+    Calculate total price and count of toys costing more than 10 EUR.
+    
+    Reads toy prices from user input until 0 is entered.
+    A toy is "magical" if its price is more than 10 EUR.
+    
+    Returns:
+        Tuple of (total_price, count) for magical toys
+    
+    Raises:
+        ValueError: If price is negative or invalid input
+    """
+    return aggregate_magical_toys(_prompt_prices())
+
+
+def calculate_magical_toys_from_stream(stream):
+    """
+    Calculate total price and count of magical toys from a price feed.
+    
+    Args:
+        stream: Readable text stream with prices (file or sys.stdin)
     
-    return total_price, count
+    Returns:
+        Tuple of (total_price, count) for magical toys
+    """
+    return aggregate_magical_toys(read_prices(stream))
 
 
-def main():
-    """Main function to display Santa's magical toy summary."""
-    print("Welcome to Santa's Toy Price Calculator!")
-    print("Enter toy prices one by one. Enter 0 when finished.\n")
+def _suffix_sums(prices):
+    """Return sums where sums[i] is the total of prices[i:], added from the last price down."""
+    sums = list(accumulate(reversed(prices), initial=0.0))
+    sums.reverse()
+    return sums
+
+
+class ToyPriceIndex:
+    """
+    Index of toy prices for repeated "count and total above X" queries.
     
-    # Calculate magical toys
-    total_price, count = calculate_magical_toys()
+    Prices are kept in a sorted array with suffix sums, so each query is a
+    binary search and one lookup. A suffix sum only adds up the prices above
+    the threshold, so many cheap toys do not cost the total any precision.
+    New prices go to a small sorted buffer with its own suffix sums, merged
+    into the main array once it grows past the square root of the index
+    size, which keeps inserts cheap without slowing queries down.
+    """
+    
+    def __init__(self, prices=()):
+        """
+        Build the index from an initial list of prices in O(n log n).
+        
+        Args:
+            prices: Iterable of non-negative toy prices
+        
+        Raises:
+            ValueError: If a price is negative or not finite
+        """
+        self._sorted = []
+        self._suffix = [0.0]
+        self._pending = []
+        self._pending_suffix = [0.0]
+        self._rebuild([float(price) for price in prices])
+    
+    def __len__(self):
+        """Return the number of indexed prices."""
+        return len(self._sorted) + len(self._pending)
     
+    def _rebuild(self, new_prices):
+        """Merge new prices into the sorted array and recompute suffix sums."""
+        # NaN compares false with everything and would break the sort order
+        if not all(map(math.isfinite, new_prices)):
+            raise ValueError("Price must be a finite number")
+        if any(price < 0 for price in new_prices):
+            raise ValueError("Price cannot be negative")
+        self._sorted = sorted(self._sorted + new_prices)
+        self._suffix = _suffix_sums(self._sorted)
+        self._pending = []
+        self._pending_suffix = [0.0]
+    
+    def add(self, price):
+        """
+        Add a new price to the index.
+        
+        Args:
+            price: Toy price (non-negative number)
+        
+        Raises:
+            ValueError: If the price is negative or not finite
+        """
+        price = float(price)
+        if not math.isfinite(price):
+            raise ValueError("Price must be a finite number")
+        if price < 0:
+            raise ValueError("Price cannot be negative")
+        
+        insort(self._pending, price)
+        if len(self._pending) ** 2 > len(self._sorted):
+            self._rebuild(self._pending)
+        else:
+            # The buffer stays under sqrt(n), so this costs no more than insort
+            self._pending_suffix = _suffix_sums(self._pending)
+    
+    def query(self, threshold=MAGICAL_THRESHOLD):
+        """
+        Return total price and count of toys costing more than the threshold.
+        
+        Args:
+            threshold: Price a toy must exceed to be counted
+        
+        Returns:
+            Tuple of (total_price, count)
+        """
+        start = bisect_right(self._sorted, threshold)
+        count = len(self._sorted) - start
+        
+        pending_start = bisect_right(self._pending, threshold)
+        count += len(self._pending) - pending_start
+        total = self._suffix[start] + self._pending_suffix[pending_start]
+        
+        return total, count
+    
+    def count_above(self, threshold=MAGICAL_THRESHOLD):
+        """Return the number of toys costing more than the threshold."""
+        return self.query(threshold)[1]
+    
+    def total_above(self, threshold=MAGICAL_THRESHOLD):
+        """Return the total price of toys costing more than the threshold."""
+        return self.query(threshold)[0]
+
+
+def display_summary(total_price, count):
+    """Display the magical toy summary."""
     # Display results
     print("\n" + "="*50)
     if count > 0:
@@ -74,6 +283,25 @@ def main():
     print("="*50)
 
 
+def main():
+    """Main function to display Santa's magical toy summary."""
+    print("Welcome to Santa's Toy Price Calculator!")
+    print("Enter toy prices one by one. Enter 0 when finished.\n")
+    
+    # Calculate magical toys
+    total_price, count = calculate_magical_toys()
+    display_summary(total_price, count)
+
+
 # Santa's workshop starts here
 if __name__ == "__main__":
-    main()
+    # "stream" argument reads prices from a file (or stdin with "-")
+    if len(sys.argv) > 1 and sys.argv[1].lower() == "stream":
+        path = sys.argv[2] if len(sys.argv) > 2 else "-"
+        if path == "-":
+            display_summary(*calculate_magical_toys_from_stream(sys.stdin))
+        else:
+            with open(path, "r") as feed:
+                display_summary(*calculate_magical_toys_from_stream(feed))
+    else:
+        main()
@@ -4,8 +4,10 @@ Santa Claus is preparing for Christmas Eve flight.
 A magical countdown from 10 to 0 in ASCII art!
 """
 
+import asyncio
 import time
-import os
+import sys
+from functools import lru_cache
 
 # ASCII DIGITS ARRAY (0–9)
 DIGITS = [
@@ -210,68 +212,307 @@ MESSAGES = [
 ]
 
 
-def clear_screen():
-    """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+# Number of composed numbers kept in the glyph cache
+COMPOSE_CACHE_SIZE = 4096
 
 
-def display_number(number):
+def compose_number(number):
     """
-    Display ASCII art for a given number.
+    Compose the ASCII art for any non-negative integer.
+    
+    Digit glyphs are joined side by side. Glyphs shorter than the tallest one
+    in the number (the 4 glyph has extra rows) are padded at the bottom with
+    blank rows of the same width. Results are kept in an LRU cache, so a
+    number is only composed once.
     
     Args:
-        number: Integer from 0 to 9
+        number: Non-negative integer
+    
+    Returns:
+        Tuple of lines of the composed number
+    
+    Raises:
+        ValueError: If the number is negative
+        TypeError: If the number is not an integer (booleans are rejected)
     """
-    if number < 0 or number > 9:
-        return
+    # Checked before the cache, which would otherwise treat 1.0 and True as 1
+    if not isinstance(number, int) or isinstance(number, bool):
+        raise TypeError("Number must be an integer")
+    if number < 0:
+        raise ValueError("Number must not be negative")
     
-    digit_art = DIGITS[number]
-    for line in digit_art:
-        print(line)
+    return _compose_number(number)
+
+
+@lru_cache(maxsize=COMPOSE_CACHE_SIZE)
+def _compose_number(number):
+    """Compose a validated non-negative integer; cached by compose_number."""
+    glyphs = [DIGITS[int(digit)] for digit in str(number)]
+    height = max(len(glyph) for glyph in glyphs)
+    
+    columns = []
+    for glyph in glyphs:
+        blank = " " * len(glyph[0])
+        columns.append(list(glyph) + [blank] * (height - len(glyph)))
+    
+    return tuple("".join(row) for row in zip(*columns))
+
+
+# ANSI escape sequences used by the frame renderer
+CURSOR_HOME = "\x1b[H"
+CLEAR_DISPLAY = "\x1b[2J"
+CLEAR_LINE = "\x1b[K"
 
 
-def countdown():
+def compose_countdown_frame(count, message=None):
     """
-    Perform the magical countdown from 10 to 0.
+    Compose one countdown frame as a list of lines.
+    
+    Args:
+        count: Timer value shown in the frame (non-negative integer)
+        message: Optional festive message shown under the number
+    
+    Returns:
+        List of lines, without trailing newlines
     """
-    messages = MESSAGES.copy()
+    lines = ["", "=" * 50, f"Timer: {count}", "=" * 50, ""]
+    lines.extend(compose_number(count))
+    
+    if message is not None:
+        lines.append("")
+        lines.append(message)
+    
+    return lines
+
+
+def compose_launch_frame():
+    """
+    Compose the final launch message as a list of lines.
     
-    for count in range(10, -1, -1):
-        clear_screen()
+    Returns:
+        List of lines, without trailing newlines
+    """
+    text = "\n".join([
+        "\n" * 5,
+        "🎅" * 20,
+        "\n" * 2,
+        "✨" * 15,
+        " SANTA'S SLEIGH IS LAUNCHING! ".center(60),
+        "✨" * 15,
+        "\n" * 2,
+        "🎅" * 20,
+        "\n" * 5,
+        "Merry Christmas! 🎄",
+        "\n",
+    ])
+    return text.split("\n")
+
+
+class FrameRenderer:
+    """
+    Write whole frames to a stream with one buffered write per frame.
+    
+    On a terminal the cursor is moved with ANSI sequences instead of clearing
+    the screen through a shell command, and with diffing enabled only the
+    lines that changed since the previous frame are redrawn. When the stream
+    is not a terminal, every frame is written as plain text.
+    """
+    
+    def __init__(self, stream=None, diff=True):
+        """
+        Initialize the renderer.
         
-        print(f"\n{'='*50}")
-        print(f"Timer: {count}")
-        print(f"{'='*50}\n")
+        Args:
+            stream: Writable text stream (defaults to sys.stdout)
+            diff: Redraw only changed lines on a terminal
+        """
+        self.stream = stream if stream is not None else sys.stdout
+        isatty = getattr(self.stream, "isatty", None)
+        self.is_tty = bool(isatty and isatty())
+        self.diff = diff
+        self._previous = None
+    
+    def render(self, lines):
+        """
+        Draw one frame.
         
-        # Display the ASCII art number
-        if count == 10:
-            # For 10, display both digits
-            print("   ", end="")
-            display_number(1)
+        Args:
+            lines: List of frame lines, without trailing newlines
+        """
+        if not self.is_tty:
+            text = "\n".join(lines) + "\n"
+        elif self._previous is None or not self.diff:
+            text = CURSOR_HOME + CLEAR_DISPLAY + "\n".join(lines) + "\n"
         else:
-            display_number(count)
+            previous = self._previous
+            parts = []
+            for row, line in enumerate(lines):
+                if row >= len(previous) or previous[row] != line:
+                    parts.append(f"\x1b[{row + 1};1H{line}{CLEAR_LINE}")
+            # Blank out rows left over from a taller previous frame
+            for row in range(len(lines), len(previous)):
+                parts.append(f"\x1b[{row + 1};1H{CLEAR_LINE}")
+            # Park the cursor below the frame
+            parts.append(f"\x1b[{len(lines) + 1};1H")
+            text = "".join(parts)
+        
+        self._previous = list(lines)
+        self.stream.write(text)
+        self.stream.flush()
+
+
+class CountdownScheduler:
+    """
+    Run frames on absolute monotonic-clock deadlines.
+    
+    Frame i fires at start + i * interval, so render time never accumulates
+    into drift. A frame that overruns its slot delays only the frames it
+    actually overlaps; later frames are back on schedule.
+    """
+    
+    def __init__(self, interval=1.0, clock=time.monotonic, sleep=time.sleep):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            interval: Seconds between frames
+            clock: Monotonic clock function
+            sleep: Sleep function
+        """
+        self.interval = interval
+        self.clock = clock
+        self.sleep = sleep
+        self.latencies = []
+        self.overruns = 0
+    
+    def run(self, frames):
+        """
+        Run frames one per interval, starting immediately.
         
+        Args:
+            frames: Iterable of zero-argument callables that draw one frame
+        """
+        start = self.clock()
+        
+        for index, frame in enumerate(frames):
+            remaining = start + index * self.interval - self.clock()
+            if remaining > 0:
+                self.sleep(remaining)
+            
+            began = self.clock()
+            frame()
+            latency = self.clock() - began
+            
+            self.latencies.append(latency)
+            if latency > self.interval:
+                self.overruns += 1
+    
+    def stats(self):
+        """
+        Return render latency statistics for the frames run so far.
+        
+        Returns:
+            Dictionary with frame count, mean and max latency in seconds,
+            and the number of frames that overran their interval
+        """
+        count = len(self.latencies)
+        return {
+            "frames": count,
+            "mean_latency": sum(self.latencies) / count if count else 0.0,
+            "max_latency": max(self.latencies, default=0.0),
+            "overruns": self.overruns,
+        }
+
+
+def countdown(renderer=None, scheduler=None, start=10):
+    """
+    Perform the magical countdown from start (10 by default) to 0.
+    
+    Args:
+        renderer: FrameRenderer used to draw frames (defaults to stdout)
+        scheduler: CountdownScheduler timing the frames (defaults to 1 second)
+        start: Number the countdown starts from
+    
+    Returns:
+        The scheduler, for render latency statistics
+    """
+    if renderer is None:
+        renderer = FrameRenderer()
+    if scheduler is None:
+        scheduler = CountdownScheduler()
+    
+    messages = MESSAGES.copy()
+    frames = []
+    
+    for count in range(start, -1, -1):
         # Display a festive message
-        if messages:
-            message = messages.pop(0)
-            print(f"\n{message}")
+        message = messages.pop(0) if messages else None
+        lines = compose_countdown_frame(count, message)
+        frames.append(lambda lines=lines: renderer.render(lines))
+    
+    # Final launch message, one second after the last number
+    frames.append(lambda: renderer.render(compose_launch_frame()))
+    
+    scheduler.run(frames)
+    return scheduler
+
+
+async def countdown_async(sink, start=10, interval=1.0, messages=None):
+    """
+    Run one countdown as a coroutine on the current event loop.
+    
+    Frames fire on absolute event-loop deadlines, like CountdownScheduler,
+    but the timer waits with asyncio.sleep so any number of countdowns can
+    share one thread.
+    
+    Args:
+        sink: Writable text stream that receives this timer's frames
+        start: Number the countdown starts from
+        interval: Seconds between frames
+        messages: Festive messages for this timer (defaults to a copy of MESSAGES)
+    """
+    loop = asyncio.get_running_loop()
+    renderer = FrameRenderer(sink)
+    messages = list(MESSAGES if messages is None else messages)
+    begin = loop.time()
+    
+    for index, count in enumerate(range(start, -1, -1)):
+        delay = begin + index * interval - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
         
-        # Wait 1 second before next countdown
-        time.sleep(1)
+        message = messages.pop(0) if messages else None
+        renderer.render(compose_countdown_frame(count, message))
+    
+    # Final launch message, one interval after the last number
+    delay = begin + (start + 1) * interval - loop.time()
+    if delay > 0:
+        await asyncio.sleep(delay)
+    renderer.render(compose_launch_frame())
+
+
+async def run_countdowns_async(sinks, start=10, interval=1.0):
+    """
+    Run one independent countdown per sink concurrently.
     
-    # Final launch message
-    clear_screen()
-    print("\n" * 5)
-    print("🎅" * 20)
-    print("\n" * 2)
-    print("✨" * 15)
-    print(" SANTA'S SLEIGH IS LAUNCHING! ".center(60))
-    print("✨" * 15)
-    print("\n" * 2)
-    print("🎅" * 20)
-    print("\n" * 5)
-    print("Merry Christmas! 🎄")
-    print("\n")
+    Args:
+        sinks: Iterable of writable text streams, one per timer
+        start: Number every countdown starts from
+        interval: Seconds between frames
+    """
+    await asyncio.gather(*(countdown_async(sink, start, interval) for sink in sinks))
+
+
+def run_countdowns(sinks, start=10, interval=1.0):
+    """
+    Run many countdowns on a single event loop until all have launched.
+    
+    Args:
+        sinks: Iterable of writable text streams, one per timer
+        start: Number every countdown starts from
+        interval: Seconds between frames
+    """
+    asyncio.run(run_countdowns_async(sinks, start, interval))
 
 
 def main():
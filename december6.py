@@ -5,6 +5,12 @@ Calculates the landing time after a flight duration.
 Handles flights that extend past midnight (next day).
 """
 
+from array import array
+from bisect import bisect_right
+
+
+MINUTES_PER_DAY = 24 * 60
+
 
 def calculate_landing_time(takeoff_hour, takeoff_minute, flight_duration_minutes):
     """
@@ -50,6 +56,203 @@ def calculate_landing_time(takeoff_hour, takeoff_minute, flight_duration_minutes
     return landing_hour, landing_minute
 
 
+def calculate_days_passed(takeoff_hour, takeoff_minute, flight_duration_minutes):
+    """
+    Calculate how many midnights the sleigh crosses during the flight.
+    
+    Args:
+        takeoff_hour: Hour of takeoff (0-23)
+        takeoff_minute: Minute of takeoff (0-59)
+        flight_duration_minutes: Duration of flight in minutes
+    
+    Returns:
+        Number of days between takeoff and landing (0 for same-day landing)
+    """
+    return (takeoff_hour * 60 + takeoff_minute + flight_duration_minutes) // MINUTES_PER_DAY
+
+
+def calculate_landing_times(takeoff_hours, takeoff_minutes, flight_durations):
+    """
+    Calculate landing times for a whole fleet in one pass.
+    
+    Invalid flights (wrong types, out-of-range takeoff time or negative
+    duration) do not raise; they get zeros and are flagged with 0 in the
+    validity mask.
+    
+    Args:
+        takeoff_hours: Sequence of takeoff hours (0-23)
+        takeoff_minutes: Sequence of takeoff minutes (0-59)
+        flight_durations: Sequence of flight durations in minutes
+    
+    Returns:
+        Tuple of (landing_hours, landing_minutes, day_offsets, valid) where
+        the first three are array('l') and valid is a bytearray with 1 for
+        valid flights
+    
+    Raises:
+        ValueError: If the input sequences have different lengths
+    """
+    size = len(takeoff_hours)
+    if len(takeoff_minutes) != size or len(flight_durations) != size:
+        raise ValueError("All input sequences must have the same length")
+    
+    landing_hours = array('l', bytes(array('l').itemsize * size))
+    landing_minutes = array('l', landing_hours)
+    day_offsets = array('l', landing_hours)
+    valid = bytearray(size)
+    
+    for i, (hour, minute, duration) in enumerate(zip(takeoff_hours, takeoff_minutes, flight_durations)):
+        if not isinstance(hour, int) or not isinstance(minute, int) or not isinstance(duration, int):
+            continue
+        if not (0 <= hour <= 23 and 0 <= minute <= 59 and duration >= 0):
+            continue
+        
+        days, minute_of_day = divmod(hour * 60 + minute + duration, MINUTES_PER_DAY)
+        landing_hours[i], landing_minutes[i] = divmod(minute_of_day, 60)
+        day_offsets[i] = days
+        valid[i] = 1
+    
+    return landing_hours, landing_minutes, day_offsets, valid
+
+
+class FlightIntervalIndex:
+    """
+    Index of many flights for "who is airborne when" queries.
+    
+    Every flight is the half-open interval [takeoff, landing) in minutes
+    since midnight of the takeoff day, so a sleigh that lands at minute t is
+    no longer airborne at t. Counting queries use sorted takeoff and landing
+    arrays (two binary searches each); listing queries use a centered
+    interval tree. Flights with zero duration are never airborne.
+    """
+    
+    def __init__(self, flights):
+        """
+        Build the index in O(n log n).
+        
+        Args:
+            flights: Iterable of (takeoff_hour, takeoff_minute, flight_duration_minutes);
+                flight ids are positions in this iterable
+        
+        Raises:
+            ValueError: If a flight has parameters out of valid range
+            TypeError: If a flight has non-integer parameters
+        """
+        intervals = []
+        for flight_id, (hour, minute, duration) in enumerate(flights):
+            # Same validation as a single flight
+            calculate_landing_time(hour, minute, duration)
+            if duration > 0:
+                start = hour * 60 + minute
+                intervals.append((start, start + duration, flight_id))
+        
+        self.size = len(intervals)
+        self._starts = sorted(start for start, _, _ in intervals)
+        self._ends = sorted(end for _, end, _ in intervals)
+        self._root = self._build(intervals)
+        self._peak = self._sweep_peak()
+    
+    @staticmethod
+    def _build(intervals):
+        """Build a centered interval tree node as [center, by_start, by_end, left, right]."""
+        if not intervals:
+            return None
+        
+        starts = sorted(start for start, _, _ in intervals)
+        center = starts[len(starts) // 2]
+        
+        left = [interval for interval in intervals if interval[1] <= center]
+        right = [interval for interval in intervals if interval[0] > center]
+        overlapping = [interval for interval in intervals if interval[0] <= center < interval[1]]
+        
+        return [
+            center,
+            sorted(overlapping),
+            sorted(overlapping, key=lambda interval: interval[1], reverse=True),
+            FlightIntervalIndex._build(left),
+            FlightIntervalIndex._build(right),
+        ]
+    
+    def _sweep_peak(self):
+        """Find the peak number of concurrent flights and the first minute it occurs."""
+        peak, peak_time = 0, None
+        airborne = 0
+        landed = 0
+        ends = self._ends
+        
+        for start in self._starts:
+            # Landings at the same minute happen before takeoffs
+            while ends[landed] <= start:
+                landed += 1
+                airborne -= 1
+            airborne += 1
+            if airborne > peak:
+                peak, peak_time = airborne, start
+        
+        return peak, peak_time
+    
+    def airborne_at(self, minute):
+        """
+        List the flights airborne at a given minute.
+        
+        Runs in O(log n + k) for k matching flights.
+        
+        Args:
+            minute: Minutes since midnight of the takeoff day
+        
+        Returns:
+            Sorted list of flight ids
+        """
+        found = []
+        node = self._root
+        
+        while node is not None:
+            center, by_start, by_end, left, right = node
+            if minute < center:
+                for start, _, flight_id in by_start:
+                    if start > minute:
+                        break
+                    found.append(flight_id)
+                node = left
+            else:
+                for _, end, flight_id in by_end:
+                    if end <= minute:
+                        break
+                    found.append(flight_id)
+                node = right
+        
+        found.sort()
+        return found
+    
+    def count_airborne_at(self, minute):
+        """Return how many flights are airborne at a given minute, in O(log n)."""
+        return bisect_right(self._starts, minute) - bisect_right(self._ends, minute)
+    
+    def count_overlapping(self, first_minute, last_minute):
+        """
+        Return how many flights are airborne at some point in [first_minute, last_minute].
+        
+        A flight overlaps unless it takes off after the window or lands at or
+        before its first minute, which gives the count in O(log n).
+        """
+        if first_minute > last_minute:
+            raise ValueError("Window start must not be after window end")
+        
+        later = self.size - bisect_right(self._starts, last_minute)
+        earlier = bisect_right(self._ends, first_minute)
+        return self.size - later - earlier
+    
+    def peak_concurrent(self):
+        """
+        Return the peak number of flights in the air at once.
+        
+        Returns:
+            Tuple of (peak_count, first_minute_of_peak); the minute is None
+            when there are no flights
+        """
+        return self._peak
+
+
 def main():
     """Main function to handle user input and display results."""
     try:
@@ -66,11 +269,9 @@ def main():
         print(f"Landing time: {v:02d}:{m:02d}")
         
         # Check if landing is on the next day
-        takeoff_total = a * 60 + b
-        landing_total = takeoff_total + c
+        days_passed = calculate_days_passed(a, b, c)
         
-        if landing_total >= 24 * 60:
-            days_passed = landing_total // (24 * 60)
+        if days_passed > 0:
             print(f"\n🎅 Santa lands on the next day (after {days_passed} day(s))!")
         else:
             print(f"\n✨ Safe landing on the same day!")
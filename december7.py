@@ -5,6 +5,15 @@ Each row has 2 more seats than the previous row.
 Calculates the total number of seats needed.
 """
 
+import math
+import threading
+from itertools import islice
+
+
+# Halls with more rows than this are verified by sampling instead of row by row
+VERIFY_FULL_ROWS = 50
+VERIFY_SAMPLES = 10
+
 
 def calculate_total_seats(num_rows, first_row_seats):
     """
@@ -50,27 +59,376 @@ def calculate_total_seats(num_rows, first_row_seats):
     return total_seats
 
 
-def display_seating_plan(num_rows, first_row_seats):
+def _validate_positive_ints(**values):
+    """Raise TypeError/ValueError unless every value is a positive integer."""
+    for name, value in values.items():
+        if not isinstance(value, int):
+            raise TypeError(f"{name} must be an integer")
+        if value <= 0:
+            raise ValueError(f"{name} must be positive (greater than 0)")
+
+
+def seats_in_row(row, first_row_seats):
     """
-    Display the seating plan visually.
+    Return the number of seats in a row: k + 2*(row-1).
+    
+    Args:
+        row: Row number (1-indexed)
+        first_row_seats: Number of seats in first row (k)
+    """
+    _validate_positive_ints(row=row, first_row_seats=first_row_seats)
+    return first_row_seats + 2 * (row - 1)
+
+
+def seats_before_row(row, first_row_seats):
+    """
+    Return the number of seats in all rows before the given row.
+    
+    Same formula as calculate_total_seats for (row - 1) rows:
+    (row-1) * (k + row - 2).
+    
+    Args:
+        row: Row number (1-indexed)
+        first_row_seats: Number of seats in first row (k)
+    """
+    _validate_positive_ints(row=row, first_row_seats=first_row_seats)
+    return (row - 1) * (first_row_seats + row - 2)
+
+
+def seats_in_rows(first_row, last_row, first_row_seats):
+    """
+    Return the number of seats in rows first_row..last_row in O(1).
+    
+    Formula: s = count * (k + a + b - 2) for rows a..b, count = b - a + 1
+    
+    Args:
+        first_row: First row of the range (1-indexed)
+        last_row: Last row of the range, inclusive
+        first_row_seats: Number of seats in first row (k)
+    
+    Raises:
+        ValueError: If the range is empty or parameters are not positive
+        TypeError: If inputs are not integers
+    """
+    _validate_positive_ints(first_row=first_row, last_row=last_row, first_row_seats=first_row_seats)
+    if last_row < first_row:
+        raise ValueError("Last row must not be before first row")
+    
+    count = last_row - first_row + 1
+    return count * (first_row_seats + first_row + last_row - 2)
+
+
+def locate_seat(seat_number, num_rows, first_row_seats):
+    """
+    Find the row and position of a seat number in O(1).
+    
+    Seats are numbered from 1 across rows, row by row. The row is the largest
+    r with seats_before_row(r) < seat_number; with x = r - 1 this is the
+    quadratic x*(x + k - 1) < seat_number, solved with an integer square root.
+    
+    Args:
+        seat_number: Seat number (1-indexed, up to the total seat count)
+        num_rows: Number of rows (n)
+        first_row_seats: Number of seats in first row (k)
+    
+    Returns:
+        Tuple of (row, position) where both are 1-indexed
+    
+    Raises:
+        ValueError: If the seat number is outside the hall
+        TypeError: If inputs are not integers
+    """
+    _validate_positive_ints(seat_number=seat_number, num_rows=num_rows, first_row_seats=first_row_seats)
+    if seat_number > calculate_total_seats(num_rows, first_row_seats):
+        raise ValueError("Seat number is larger than the number of seats")
+    
+    k = first_row_seats
+    limit = seat_number - 1
+    
+    # Largest x with x*(x + k - 1) <= seat_number - 1
+    x = (math.isqrt((k - 1) ** 2 + 4 * limit) - (k - 1)) // 2
+    while (x + 1) * (x + k) <= limit:
+        x += 1
+    while x * (x + k - 1) > limit:
+        x -= 1
+    
+    return x + 1, seat_number - x * (x + k - 1)
+
+
+def verify_total_seats(num_rows, first_row_seats, samples=VERIFY_SAMPLES):
+    """
+    Check calculate_total_seats without looping over every row.
+    
+    The total is recomputed independently as n * (first + last) / 2, and for
+    a few evenly spread rows the closed-form row offsets are checked against
+    the row sizes and locate_seat.
+    
+    Args:
+        num_rows: Number of rows (n)
+        first_row_seats: Number of seats in first row (k)
+        samples: Number of rows to sample
+    
+    Returns:
+        Tuple of (series_total, sampled_rows, consistent) where sampled_rows
+        is a list of (row, seats) and consistent tells if every sampled row
+        agreed
+    """
+    last_row_seats = seats_in_row(num_rows, first_row_seats)
+    series_total = num_rows * (first_row_seats + last_row_seats) // 2
+    
+    step = max(1, num_rows // samples)
+    rows = sorted(set(range(1, num_rows + 1, step)) | {num_rows})
+    
+    sampled_rows = []
+    consistent = True
+    for row in rows:
+        seats = seats_in_row(row, first_row_seats)
+        offset = seats_before_row(row, first_row_seats)
+        sampled_rows.append((row, seats))
+        if seats_in_rows(row, row, first_row_seats) != seats:
+            consistent = False
+        if locate_seat(offset + 1, num_rows, first_row_seats) != (row, 1):
+            consistent = False
+        if locate_seat(offset + seats, num_rows, first_row_seats) != (row, seats):
+            consistent = False
+    
+    return series_total, sampled_rows, consistent
+
+
+class SeatBookingEngine:
+    """
+    Thread-safe seat reservations stored in one compact bitmap.
+    
+    Seat (row, position) is bit seats_before_row(row) + position - 1 of a
+    bytearray, so the whole hall takes one bit per seat. Row scans read the
+    row's bits as one Python integer and use word-level shifts and masks
+    instead of looping over seats.
+    """
+    
+    def __init__(self, num_rows, first_row_seats):
+        """
+        Initialize an empty hall.
+        
+        Args:
+            num_rows: Number of rows (n)
+            first_row_seats: Number of seats in first row (k)
+        
+        Raises:
+            ValueError: If parameters are invalid
+            TypeError: If inputs are not numeric
+        """
+        self.total_seats = calculate_total_seats(num_rows, first_row_seats)
+        self.num_rows = num_rows
+        self.first_row_seats = first_row_seats
+        self._bits = bytearray((self.total_seats + 7) // 8)
+        self._lock = threading.Lock()
+    
+    def _row_span(self, row):
+        """Return (bit offset, seat count) of a row."""
+        if not isinstance(row, int):
+            raise TypeError("Row must be an integer")
+        if not (1 <= row <= self.num_rows):
+            raise ValueError(f"Row must be between 1 and {self.num_rows}")
+        return seats_before_row(row, self.first_row_seats), seats_in_row(row, self.first_row_seats)
+    
+    def _seat_bit(self, row, position):
+        """Return the bit offset of a seat."""
+        offset, seats = self._row_span(row)
+        if not isinstance(position, int):
+            raise TypeError("Position must be an integer")
+        if not (1 <= position <= seats):
+            raise ValueError(f"Position must be between 1 and {seats} in row {row}")
+        return offset + position - 1
+    
+    def _read_bits(self, start, length):
+        """Read length bits starting at bit start as an integer (bit 0 = first seat)."""
+        first, last = start >> 3, (start + length - 1) >> 3
+        chunk = int.from_bytes(self._bits[first:last + 1], "little")
+        return (chunk >> (start & 7)) & ((1 << length) - 1)
+    
+    def _set_bits(self, start, length, value):
+        """Set (value=True) or clear length bits starting at bit start."""
+        first, last = start >> 3, (start + length - 1) >> 3
+        chunk = int.from_bytes(self._bits[first:last + 1], "little")
+        mask = ((1 << length) - 1) << (start & 7)
+        chunk = chunk | mask if value else chunk & ~mask
+        self._bits[first:last + 1] = chunk.to_bytes(last - first + 1, "little")
+    
+    def is_reserved(self, row, position):
+        """Return True if the seat is reserved."""
+        bit = self._seat_bit(row, position)
+        return bool(self._bits[bit >> 3] >> (bit & 7) & 1)
+    
+    def reserve(self, row, position):
+        """
+        Reserve one seat.
+        
+        Returns:
+            True if the seat was reserved, False if it was already taken
+        """
+        bit = self._seat_bit(row, position)
+        with self._lock:
+            if self._bits[bit >> 3] >> (bit & 7) & 1:
+                return False
+            self._bits[bit >> 3] |= 1 << (bit & 7)
+            return True
+    
+    def release(self, row, position):
+        """
+        Release one seat.
+        
+        Returns:
+            True if the seat was released, False if it was not reserved
+        """
+        bit = self._seat_bit(row, position)
+        with self._lock:
+            if not self._bits[bit >> 3] >> (bit & 7) & 1:
+                return False
+            self._bits[bit >> 3] &= ~(1 << (bit & 7)) & 0xFF
+            return True
+    
+    def free_seats(self, row):
+        """Return the number of free seats in a row."""
+        offset, seats = self._row_span(row)
+        with self._lock:
+            occupied = self._read_bits(offset, seats)
+        return seats - bin(occupied).count("1")
+    
+    def _find_block(self, offset, seats, count):
+        """Return the first position starting count contiguous free seats, or None."""
+        runs = ~self._read_bits(offset, seats) & ((1 << seats) - 1)
+        
+        # After this, bit i is set only if seats i..i+count-1 are all free
+        length = 1
+        while length < count and runs:
+            shift = min(length, count - length)
+            runs &= runs >> shift
+            length += shift
+        
+        if not runs:
+            return None
+        return (runs & -runs).bit_length()
+    
+    def find_free_block(self, row, count):
+        """
+        Find count contiguous free seats in a row.
+        
+        Args:
+            row: Row number (1-indexed)
+            count: Number of adjacent seats needed
+        
+        Returns:
+            Position of the first seat of the leftmost free block, or None
+        """
+        offset, seats = self._row_span(row)
+        if not isinstance(count, int) or count <= 0:
+            raise ValueError("Seat count must be a positive integer")
+        if count > seats:
+            return None
+        with self._lock:
+            return self._find_block(offset, seats, count)
+    
+    def reserve_block(self, row, count):
+        """
+        Atomically find and reserve count contiguous free seats in a row.
+        
+        Returns:
+            Position of the first reserved seat, or None if no block is free
+        """
+        offset, seats = self._row_span(row)
+        if not isinstance(count, int) or count <= 0:
+            raise ValueError("Seat count must be a positive integer")
+        if count > seats:
+            return None
+        with self._lock:
+            position = self._find_block(offset, seats, count)
+            if position is not None:
+                self._set_bits(offset + position - 1, count, True)
+            return position
+
+
+# Rows written per buffered chunk when saving a seating plan to a file
+PLAN_CHUNK_ROWS = 4096
+
+
+def iter_seating_plan(num_rows, first_row_seats, first_row=1, last_row=None):
+    """
+    Generate the seating plan lines for rows first_row..last_row lazily.
+    
+    Rows are produced one at a time from the closed-form row size, so the
+    time and memory for a page do not depend on the total number of rows.
+    The full plan ends with the total seat count; a page ends with the seat
+    count of its rows.
     
     Args:
         num_rows: Number of rows
         first_row_seats: Number of seats in first row
+        first_row: First row of the page (1-indexed)
+        last_row: Last row of the page, inclusive (defaults to num_rows)
+    
+    Yields:
+        Plan lines, without trailing newlines
+    
+    Raises:
+        ValueError: If the page is outside the hall
+        TypeError: If inputs are not integers
+    """
+    if last_row is None:
+        last_row = num_rows
+    _validate_positive_ints(num_rows=num_rows, first_row_seats=first_row_seats,
+                            first_row=first_row, last_row=last_row)
+    if not (first_row <= last_row <= num_rows):
+        raise ValueError(f"Rows must satisfy 1 <= first_row <= last_row <= {num_rows}")
+    
+    yield ""
+    yield "="*50
+    yield "SEATING PLAN"
+    yield "="*50
+    
+    for row in range(first_row, last_row + 1):
+        row_seats = first_row_seats + 2 * (row - 1)
+        yield f"Row {row:2d}: {row_seats:3d} seats {'🎄' * (row_seats // 2)}"
+    
+    yield "="*50
+    if first_row == 1 and last_row == num_rows:
+        yield f"Total seats: {calculate_total_seats(num_rows, first_row_seats)}"
+    else:
+        yield f"Seats in rows {first_row}-{last_row}: {seats_in_rows(first_row, last_row, first_row_seats)}"
+    yield "="*50
+    yield ""
+
+
+def display_seating_plan(num_rows, first_row_seats, first_row=1, last_row=None):
     """
-    print("\n" + "="*50)
-    print("SEATING PLAN")
-    print("="*50)
+    Display the seating plan visually.
     
-    total = 0
-    for row in range(1, num_rows + 1):
-        seats_in_row = first_row_seats + 2 * (row - 1)
-        total += seats_in_row
-        print(f"Row {row:2d}: {seats_in_row:3d} seats {'🎄' * (seats_in_row // 2)}")
+    Args:
+        num_rows: Number of rows
+        first_row_seats: Number of seats in first row
+        first_row: First row to display (1-indexed)
+        last_row: Last row to display, inclusive (defaults to num_rows)
+    """
+    for line in iter_seating_plan(num_rows, first_row_seats, first_row, last_row):
+        print(line)
+
+
+def write_seating_plan(path, num_rows, first_row_seats, chunk_rows=PLAN_CHUNK_ROWS):
+    """
+    Write the whole seating plan to a file in buffered chunks.
     
-    print("="*50)
-    print(f"Total seats: {total}")
-    print("="*50 + "\n")
+    Args:
+        path: Output file path
+        num_rows: Number of rows
+        first_row_seats: Number of seats in first row
+        chunk_rows: Number of lines joined per write
+    """
+    lines = iter_seating_plan(num_rows, first_row_seats)
+    with open(path, "w", encoding="utf-8") as plan_file:
+        while True:
+            chunk = list(islice(lines, chunk_rows))
+            if not chunk:
+                break
+            plan_file.write("\n".join(chunk) + "\n")
 
 
 def main():
@@ -94,14 +452,22 @@ def main():
         
         # Verify with manual calculation
         print("\nVerification:")
-        manual_total = 0
-        for row in range(1, n + 1):
-            seats_in_row = k + 2 * (row - 1)
-            manual_total += seats_in_row
-            print(f"  Row {row}: {seats_in_row} seats")
-        print(f"  Manual total: {manual_total}")
+        if n <= VERIFY_FULL_ROWS:
+            manual_total = 0
+            for row in range(1, n + 1):
+                row_seats = k + 2 * (row - 1)
+                manual_total += row_seats
+                print(f"  Row {row}: {row_seats} seats")
+            print(f"  Manual total: {manual_total}")
+            consistent = True
+        else:
+            # Too many rows to list, check sampled rows and the series sum
+            manual_total, sampled_rows, consistent = verify_total_seats(n, k)
+            for row, row_seats in sampled_rows:
+                print(f"  Row {row}: {row_seats} seats")
+            print(f"  Series total: {manual_total}")
         
-        if manual_total == s:
+        if manual_total == s and consistent:
             print("✅ Calculation verified!")
         else:
             print("❌ Calculation error!")
@@ -4,6 +4,99 @@ Santa's programmable Christmas lights system.
 Generates an N × N grid of lights based on numeric rules.
 """
 
+import mmap
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+
+# Grid rows written to the terminal per batch
+DISPLAY_BATCH_ROWS = 1024
+
+# Calculation details rows written per batch
+DETAILS_BATCH_LINES = 8192
+
+
+def light_for_sum(total):
+    """
+    Return the light for a cell whose row + col equals total.
+    
+    Args:
+        total: Sum of the cell's row and column
+    
+    Returns:
+        'G', 'S', 'T' or '.'
+    """
+    # Check divisibility rules (check both 3 and 5 first)
+    if total % 15 == 0:  # Divisible by both 3 and 5
+        return 'G'
+    elif total % 5 == 0:  # Divisible by 5
+        return 'S'
+    elif total % 3 == 0:  # Divisible by 3
+        return 'T'
+    else:  # Not divisible by 3 or 5
+        return '.'
+
+
+# Light for each value of (row + col) mod 15; the pattern repeats with this period
+LIGHT_PERIOD = "".join(light_for_sum(total) for total in range(15))
+
+
+def _validate_grid_size(n):
+    """Raise TypeError/ValueError unless n is a positive integer."""
+    if not isinstance(n, int):
+        raise TypeError("Grid size must be an integer")
+    
+    if n <= 0:
+        raise ValueError("Grid size must be positive (greater than 0)")
+
+
+def _period_rows(n):
+    """Return the distinct grid rows; row r (1-indexed) is rows[(r - 1) % len(rows)]."""
+    # One period of cells with their separating spaces, repeated past the row width
+    buffer = "".join(light + ' ' for light in LIGHT_PERIOD) * (n // 15 + 2)
+    
+    # Row r (1-indexed) starts at sum (r + 1) mod 15, so there are only 15 distinct rows
+    rows = []
+    for offset in range(min(n, 15)):
+        start = 2 * ((offset + 2) % 15)
+        rows.append('# ' + buffer[start:start + 2 * n] + '#')
+    return rows
+
+
+def _iter_rows(n):
+    """Yield the bordered grid rows; see iter_lights_pattern."""
+    border = '#' * (n * 2 + 3)
+    rows = _period_rows(n)
+    
+    yield border
+    period = len(rows)
+    for row in range(n):
+        yield rows[row % period]
+    yield border
+
+
+def iter_lights_pattern(n):
+    """
+    Generate the N × N Christmas lights grid row by row.
+    
+    A cell only depends on (row + col) mod 15, so one period of cells is
+    precomputed and every row is a slice of that period repeated. Output is
+    identical to generate_lights_pattern.
+    
+    Args:
+        n: Grid size (positive integer)
+    
+    Returns:
+        Iterator over the grid rows, including the top and bottom border
+    
+    Raises:
+        ValueError: If n is not positive
+        TypeError: If n is not numeric
+    """
+    _validate_grid_size(n)
+    return _iter_rows(n)
+
 
 def generate_lights_pattern(n):
     """
@@ -25,64 +118,267 @@ def generate_lights_pattern(n):
         ValueError: If n is not positive
         TypeError: If n is not numeric
     """
-    # Validate input
-    if not isinstance(n, int):
-        raise TypeError("Grid size must be an integer")
+    return list(iter_lights_pattern(n))
+
+
+def light_at(row, col):
+    """
+    Return the light of a single cell in O(1), without rendering the grid.
     
-    if n <= 0:
-        raise ValueError("Grid size must be positive (greater than 0)")
+    Args:
+        row: Row number (1-indexed)
+        col: Column number (1-indexed)
     
-    grid = []
+    Returns:
+        'G', 'S', 'T' or '.'
     
-    # Add top border
-    top_border = '#' * (n * 2 + 3)
-    grid.append(top_border)
+    Raises:
+        ValueError: If row or col is not positive
+        TypeError: If row or col is not an integer
+    """
+    _validate_cell_range(row, row, col, col)
+    return LIGHT_PERIOD[(row + col) % 15]
+
+
+def _validate_cell_range(first_row, last_row, first_col, last_col):
+    """Raise TypeError/ValueError unless the bounds describe a non-empty rectangle."""
+    for value in (first_row, last_row, first_col, last_col):
+        if not isinstance(value, int):
+            raise TypeError("Row and column numbers must be integers")
+        if value <= 0:
+            raise ValueError("Row and column numbers must be positive (greater than 0)")
     
-    # Generate each row
-    for row in range(1, n + 1):
-        row_str = '# '
-        
-        for col in range(1, n + 1):
-            total = row + col
-            
-            # Check divisibility rules (check both 3 and 5 first)
-            if total % 15 == 0:  # Divisible by both 3 and 5
-                row_str += 'G'
-            elif total % 5 == 0:  # Divisible by 5
-                row_str += 'S'
-            elif total % 3 == 0:  # Divisible by 3
-                row_str += 'T'
-            else:  # Not divisible by 3 or 5
-                row_str += '.'
-            
-            # Add space between characters
-            row_str += ' '
-        
-        row_str += '#'
-        grid.append(row_str)
+    if first_row > last_row or first_col > last_col:
+        raise ValueError("First row/column must not be after the last one")
+
+
+def _residue_counts(first, last):
+    """Count how many numbers in first..last fall into each residue class mod 15."""
+    return [(last - residue) // 15 - (first - 1 - residue) // 15 for residue in range(15)]
+
+
+def count_lights(first_row, last_row, first_col, last_col):
+    """
+    Count each light type in a rectangle of the grid without rendering it.
     
-    # Add bottom border
-    bottom_border = '#' * (n * 2 + 3)
-    grid.append(bottom_border)
+    Only (row + col) mod 15 matters, so the rows and columns of the rectangle
+    are bucketed by residue and the 15 × 15 bucket pairs are combined. The
+    cost does not depend on the size of the rectangle.
     
-    return grid
+    Args:
+        first_row: First row of the rectangle (1-indexed)
+        last_row: Last row of the rectangle, inclusive
+        first_col: First column of the rectangle (1-indexed)
+        last_col: Last column of the rectangle, inclusive
+    
+    Returns:
+        Dictionary {'G': count, 'S': count, 'T': count, '.': count}
+    
+    Raises:
+        ValueError: If the rectangle is empty or has non-positive bounds
+        TypeError: If a bound is not an integer
+    """
+    _validate_cell_range(first_row, last_row, first_col, last_col)
+    
+    row_counts = _residue_counts(first_row, last_row)
+    col_counts = _residue_counts(first_col, last_col)
+    
+    counts = {'G': 0, 'S': 0, 'T': 0, '.': 0}
+    for row_residue, rows in enumerate(row_counts):
+        if not rows:
+            continue
+        for col_residue, cols in enumerate(col_counts):
+            counts[LIGHT_PERIOD[(row_residue + col_residue) % 15]] += rows * cols
+    
+    return counts
 
 
 def display_pattern(n):
     """
     Display the Christmas lights pattern.
     
+    Rows are streamed from iter_lights_pattern and written in batches, so the
+    grid is never held in memory as a whole.
+    
     Args:
         n: Grid size
     """
-    grid = generate_lights_pattern(n)
+    rows = iter_lights_pattern(n)
     
     print()
-    for line in grid:
-        print(line)
+    while True:
+        batch = list(islice(rows, DISPLAY_BATCH_ROWS))
+        if not batch:
+            break
+        sys.stdout.write("\n".join(batch) + "\n")
     print()
 
 
+def _fill_rows(path, n, first_line, last_line):
+    """Write grid lines first_line..last_line-1 at their offsets in a pre-sized file."""
+    row_bytes = 2 * n + 4
+    border = b'#' * (n * 2 + 3) + b'\n'
+    rows = [row.encode('ascii') + b'\n' for row in _period_rows(n)]
+    period = len(rows)
+    
+    with open(path, 'r+b') as grid_file:
+        with mmap.mmap(grid_file.fileno(), (n + 2) * row_bytes) as buffer:
+            for line in range(first_line, last_line):
+                offset = line * row_bytes
+                if line == 0 or line == n + 1:
+                    buffer[offset:offset + row_bytes] = border
+                else:
+                    buffer[offset:offset + row_bytes] = rows[(line - 1) % period]
+            buffer.flush()
+
+
+def write_lights_pattern(path, n, workers=1):
+    """
+    Write the grid to a file through a pre-sized memory map.
+    
+    Every grid line (border included) is 2N + 3 characters plus a newline,
+    so line i lives at byte offset i * (2N + 4). The file is sized up front
+    and each line is copied straight to its offset; with workers > 1 the
+    lines are split into ranges filled by separate processes.
+    
+    Args:
+        path: Output file path
+        n: Grid size (positive integer)
+        workers: Number of processes filling the file
+    
+    Returns:
+        Size of the written file in bytes
+    
+    Raises:
+        ValueError: If n is not positive
+        TypeError: If n is not numeric
+    """
+    _validate_grid_size(n)
+    
+    lines = n + 2
+    size = lines * (2 * n + 4)
+    with open(path, 'wb') as grid_file:
+        grid_file.truncate(size)
+    
+    workers = max(1, min(workers, lines))
+    bounds = [lines * part // workers for part in range(workers + 1)]
+    
+    if workers == 1:
+        _fill_rows(path, n, 0, lines)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_fill_rows, path, n, bounds[part], bounds[part + 1])
+                for part in range(workers)
+            ]
+            for future in futures:
+                future.result()
+    
+    return size
+
+
+def _details_suffix(residue):
+    """Format the divisibility and result columns for a sum with the given residue mod 15."""
+    div_3 = "Yes" if residue % 3 == 0 else "No"
+    div_5 = "Yes" if residue % 5 == 0 else "No"
+    div_15 = "Yes" if residue == 0 else "No"
+    result = LIGHT_PERIOD[residue]
+    return f"{div_3:<10} {div_5:<10} {div_15:<10} {result:<5}"
+
+
+# Divisibility and result columns of the details table for each (row + col) mod 15
+DETAILS_SUFFIXES = [_details_suffix(residue) for residue in range(15)]
+
+DETAILS_HEADER = f"{'Row':<5} {'Col':<5} {'Sum':<5} {'÷3':<10} {'÷5':<10} {'÷15':<10} {'Result':<5}"
+
+
+def iter_calculation_details(n, result_filter=None, first_row=1, last_row=None):
+    """
+    Generate the calculation details table rows lazily.
+    
+    Rows can be limited to grid rows first_row..last_row and filtered by
+    result type. With a filter, only the matching columns are visited: they
+    repeat every 15 columns, so non-matching cells cost nothing.
+    
+    Args:
+        n: Grid size (positive integer)
+        result_filter: Optional collection of results to keep, e.g. "GS" or {'T'}
+        first_row: First grid row to include (1-indexed)
+        last_row: Last grid row to include (defaults to n)
+    
+    Returns:
+        Iterator over formatted table rows, without trailing newlines
+    
+    Raises:
+        ValueError: If n, the row range or the filter is invalid
+        TypeError: If n or the row range is not an integer
+    """
+    _validate_grid_size(n)
+    if last_row is None:
+        last_row = n
+    _validate_cell_range(first_row, last_row, 1, n)
+    if last_row > n:
+        raise ValueError(f"Last row must not exceed the grid size ({n})")
+    
+    if result_filter is None:
+        residues = range(15)
+    else:
+        result_filter = set(result_filter)
+        if not result_filter <= set(LIGHT_PERIOD):
+            raise ValueError("Result filter may only contain 'G', 'S', 'T' and '.'")
+        residues = [residue for residue in range(15) if LIGHT_PERIOD[residue] in result_filter]
+    
+    return _iter_details(n, residues, first_row, last_row)
+
+
+def _iter_details(n, residues, first_row, last_row):
+    """Yield details rows whose (row + col) mod 15 is in residues; see iter_calculation_details."""
+    suffixes = DETAILS_SUFFIXES
+    # Formatted column and sum cells, built once instead of once per table row
+    col_cells = [f"{col:<5} " for col in range(n + 1)]
+    sum_cells = [f"{total:<5} {suffixes[total % 15]}" for total in range(2 * n + 1)]
+    
+    for row in range(first_row, last_row + 1):
+        if len(residues) == 15:
+            columns = range(1, n + 1)
+        else:
+            # Column offsets within each block of 15 that give a matching sum
+            offsets = sorted((residue - row) % 15 for residue in residues)
+            columns = [
+                base + offset
+                for base in range(0, n + 1, 15)
+                for offset in offsets
+                if 1 <= base + offset <= n
+            ]
+        
+        row_cell = f"{row:<5} "
+        yield from [row_cell + col_cells[col] + sum_cells[row + col] for col in columns]
+
+
+def write_calculation_details(stream, n, result_filter=None, first_row=1, last_row=None,
+                              batch_lines=DETAILS_BATCH_LINES):
+    """
+    Write the calculation details table to a text stream in buffered batches.
+    
+    Args:
+        stream: Writable text stream (file or sys.stdout)
+        n: Grid size (positive integer)
+        result_filter: Optional collection of results to keep
+        first_row: First grid row to include (1-indexed)
+        last_row: Last grid row to include (defaults to n)
+        batch_lines: Number of table rows joined per write
+    """
+    rows = iter_calculation_details(n, result_filter, first_row, last_row)
+    
+    stream.write("="*60 + "\n" + DETAILS_HEADER + "\n" + "-"*60 + "\n")
+    while True:
+        batch = list(islice(rows, batch_lines))
+        if not batch:
+            break
+        stream.write("\n".join(batch) + "\n")
+    stream.write("="*60 + "\n")
+
+
 def main():
     """Main function to handle user input and display results."""
     try:
@@ -95,29 +391,8 @@ def main():
         show_details = input("Would you like to see the calculation details? (yes/no): ").lower().strip()
         if show_details in ['yes', 'y']:
             print(f"\nCalculation Details for N = {n}:")
-            print("="*60)
-            print(f"{'Row':<5} {'Col':<5} {'Sum':<5} {'÷3':<10} {'÷5':<10} {'÷15':<10} {'Result':<5}")
-            print("-"*60)
-            
-            for row in range(1, n + 1):
-                for col in range(1, n + 1):
-                    total = row + col
-                    div_3 = "Yes" if total % 3 == 0 else "No"
-                    div_5 = "Yes" if total % 5 == 0 else "No"
-                    div_15 = "Yes" if total % 15 == 0 else "No"
-                    
-                    if total % 15 == 0:
-                        result = 'G'
-                    elif total % 5 == 0:
-                        result = 'S'
-                    elif total % 3 == 0:
-                        result = 'T'
-                    else:
-                        result = '.'
-                    
-                    print(f"{row:<5} {col:<5} {total:<5} {div_3:<10} {div_5:<10} {div_15:<10} {result:<5}")
-            
-            print("="*60)
+            sys.stdout.flush()
+            write_calculation_details(sys.stdout, n)
         
     except ValueError as e:
         print(f"Error: {e}")
@@ -4,6 +4,21 @@ Santa is looking for the perfect Christmas melon.
 Finds the melon whose weight is closest to the average weight.
 """
 
+import math
+import os
+from array import array
+from bisect import bisect_left, insort
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from multiprocessing.shared_memory import SharedMemory
+
+
+# Characters of a weights file read per chunk by the streaming finder
+WEIGHT_CHUNK_BYTES = 1 << 22
+
+# Below this many weights the process pool costs more than it saves
+PARALLEL_MIN_WEIGHTS = 1 << 16
+
 
 def find_perfect_melon(weights):
     """
@@ -54,6 +69,364 @@ def find_perfect_melon(weights):
     return melon_number, average_weight
 
 
+def _closest_in_chunk(chunk, average_weight):
+    """Return (difference, index) of the first weight in chunk closest to the average."""
+    differences = [abs(weight - average_weight) for weight in chunk]
+    best = min(differences)
+    return best, differences.index(best)
+
+
+def _validate_chunk(chunk, offset):
+    """Raise ValueError for the first negative weight, numbered from offset."""
+    # Not min(chunk) < 0: min() returns a leading NaN and misses later negatives
+    negative = next((i for i, weight in enumerate(chunk) if weight < 0), None)
+    if negative is not None:
+        raise ValueError(f"Weight at position {offset + negative} must be non-negative")
+
+
+def _iter_weight_chunks(path, chunk_bytes):
+    """Read whitespace-separated weights from a file as lists of floats."""
+    with open(path, "r") as weights_file:
+        tail = ""
+        while True:
+            data = weights_file.read(chunk_bytes)
+            if not data:
+                break
+            tokens = (tail + data).split()
+            # The last token may continue in the next chunk
+            tail = tokens.pop() if tokens and not data[-1].isspace() else ""
+            if tokens:
+                yield _parse_weights(tokens)
+        if tail:
+            yield _parse_weights([tail])
+
+
+def _parse_weights(tokens):
+    """Convert weight tokens to floats."""
+    try:
+        return list(map(float, tokens))
+    except ValueError:
+        raise ValueError("All weights must be valid numbers")
+
+
+def find_perfect_melon_in_file(path, chunk_bytes=WEIGHT_CHUNK_BYTES):
+    """
+    Find the melon closest to the average weight in a weights file.
+    
+    The file holds whitespace-separated weights and is read twice in chunks:
+    the first pass computes the average, the second finds the closest
+    melon. Peak memory depends on the chunk size, not on the file size.
+    The first pass feeds every weight, in file order, to a single sum(), so
+    the average is the same float as in find_perfect_melon, and so are the
+    results, including first-index-wins tie-breaking.
+    
+    Args:
+        path: Path of the weights file
+        chunk_bytes: Approximate number of characters read per chunk
+    
+    Returns:
+        Tuple of (melon_number, average_weight)
+        where melon_number is 1-indexed position
+    
+    Raises:
+        ValueError: If the file has no weights or invalid weights
+    """
+    # First pass: sum and count, chain keeps the per-weight loop inside sum()
+    count = 0
+    
+    def checked_chunks():
+        nonlocal count
+        for chunk in _iter_weight_chunks(path, chunk_bytes):
+            _validate_chunk(chunk, count)
+            count += len(chunk)
+            yield chunk
+    
+    total = sum(chain.from_iterable(checked_chunks()))
+    
+    if count == 0:
+        raise ValueError("Must have at least one melon")
+    
+    average_weight = total / count
+    
+    # Second pass: closest melon, earlier chunks win ties
+    min_difference = float('inf')
+    closest_melon_index = 0
+    offset = 0
+    for chunk in _iter_weight_chunks(path, chunk_bytes):
+        difference, index = _closest_in_chunk(chunk, average_weight)
+        if difference < min_difference:
+            min_difference = difference
+            closest_melon_index = offset + index
+        offset += len(chunk)
+    
+    return closest_melon_index + 1, average_weight
+
+
+def _read_shared_chunk(name, start, stop):
+    """Copy weights start..stop-1 out of a shared memory block of doubles."""
+    shared = SharedMemory(name=name)
+    try:
+        with shared.buf[start * 8:stop * 8] as raw, raw.cast('d') as view:
+            return view.tolist()
+    finally:
+        shared.close()
+
+
+def _closest_task(name, start, stop, average_weight):
+    """
+    Worker: validate one chunk and find its weight closest to the average.
+    
+    Returns:
+        Tuple of (first_negative_index or None, difference, global index)
+    """
+    chunk = _read_shared_chunk(name, start, stop)
+    # Not min(chunk) < 0: min() returns a leading NaN and misses later negatives
+    negative = next((i for i, weight in enumerate(chunk) if weight < 0), None)
+    if negative is not None:
+        return start + negative, None, None
+    difference, index = _closest_in_chunk(chunk, average_weight)
+    return None, difference, start + index
+
+
+def find_perfect_melon_parallel(weights, workers=None):
+    """
+    Find the melon closest to the average weight using a process pool.
+    
+    The average is taken with the same sum() as find_perfect_melon, since a
+    float sum split into partial sums can differ from it in the last bit.
+    The weights are then copied once into shared memory and split into
+    chunks, and every worker checks its chunk for negative weights and
+    returns its best candidate. Results, including first-index-wins
+    tie-breaking, match find_perfect_melon exactly. Small inputs, a single
+    worker or weights that are not plain numbers are handed to
+    find_perfect_melon directly.
+    
+    Args:
+        weights: List of melon weights (positive real numbers)
+        workers: Number of worker processes (defaults to the CPU count)
+    
+    Returns:
+        Tuple of (melon_number, average_weight)
+        where melon_number is 1-indexed position
+    
+    Raises:
+        ValueError: If weights list is empty or invalid
+        TypeError: If weights are not numeric
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    if workers <= 1 or len(weights) < PARALLEL_MIN_WEIGHTS:
+        return find_perfect_melon(weights)
+    
+    # Anything but plain ints and floats gets the scalar function's checks
+    if not set(map(type, weights)) <= {int, float, bool}:
+        return find_perfect_melon(weights)
+    
+    data = array('d', weights)
+    size = len(data)
+    average_weight = sum(weights) / size
+    
+    shared = SharedMemory(create=True, size=size * 8)
+    try:
+        with memoryview(data).cast('B') as source:
+            shared.buf[:size * 8] = source
+        
+        # Never more chunks than weights, so no worker gets an empty chunk
+        chunks = min(workers * 4, size)
+        bounds = [size * part // chunks for part in range(chunks + 1)]
+        starts, stops = bounds[:-1], bounds[1:]
+        names = [shared.name] * chunks
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_closest_task, names, starts, stops, [average_weight] * chunks))
+    finally:
+        shared.close()
+        shared.unlink()
+    
+    # Chunks come back in order, so the first negative found is the lowest
+    for negative, _, _ in results:
+        if negative is not None:
+            raise ValueError(f"Weight at position {negative} must be non-negative")
+    
+    # Best candidate per chunk, lowest index wins ties
+    _, closest_melon_index = min((difference, index) for _, difference, index in results)
+    
+    return closest_melon_index + 1, average_weight
+
+
+def _add_to_partials(partials, value):
+    """Add value to a list of non-overlapping partial sums in place (exact, Shewchuk)."""
+    i = 0
+    for partial in partials:
+        if abs(value) < abs(partial):
+            value, partial = partial, value
+        high = value + partial
+        low = partial - (high - value)
+        if low:
+            partials[i] = low
+            i += 1
+        value = high
+    partials[i:] = [value]
+
+
+class PerfectMelonSet:
+    """
+    Melons that come and go, with fast "perfect melon" queries.
+    
+    The sum of weights is kept exactly as a few non-overlapping partials, so
+    the average is updated in O(1) and is the correctly rounded mean. It can
+    differ in the last bit from find_perfect_melon, whose sum() rounds after
+    every addition in list order, which no order of adds and removes can
+    reproduce. Weights
+    are also kept in a sorted list of (weight, melon_number) pairs, so the
+    melon closest to the average is found by bisection. Melon numbers follow
+    insertion order and are never reused; ties go to the lowest number, the
+    same first-index-wins rule as find_perfect_melon.
+    """
+    
+    def __init__(self, weights=()):
+        """
+        Initialize the set, numbering the initial melons from 1.
+        
+        Args:
+            weights: Iterable of initial melon weights
+        
+        Raises:
+            ValueError: If a weight is negative or not finite, or the total
+                weight is too large
+            TypeError: If a weight is not numeric
+        """
+        self._partials = []
+        self._entries = []
+        self._weights = {}
+        self._next_number = 1
+        for weight in weights:
+            self.add(weight)
+    
+    def __len__(self):
+        """Return the number of melons in the set."""
+        return len(self._weights)
+    
+    def add(self, weight):
+        """
+        Add a melon.
+        
+        Args:
+            weight: Melon weight (non-negative number)
+        
+        Returns:
+            Melon number of the new melon
+        
+        Raises:
+            ValueError: If the weight is negative or not finite, or the total
+                weight is too large
+            TypeError: If the weight is not numeric
+        """
+        if not isinstance(weight, (int, float)):
+            raise TypeError("Weight must be numeric")
+        if weight < 0:
+            raise ValueError("Weight must be non-negative")
+        
+        # The partials cannot hold inf or nan: removing such a melon again
+        # would leave nan behind, so the set only takes finite totals
+        try:
+            weight = float(weight)
+        except OverflowError:
+            raise ValueError("Weight must be finite") from None
+        if not math.isfinite(weight):
+            raise ValueError("Weight must be finite")
+        
+        partials = list(self._partials)
+        _add_to_partials(partials, weight)
+        if not all(map(math.isfinite, partials)):
+            raise ValueError("Total weight is too large")
+        try:
+            math.fsum(partials)
+        except OverflowError:
+            raise ValueError("Total weight is too large") from None
+        
+        melon_number = self._next_number
+        self._next_number += 1
+        
+        self._weights[melon_number] = weight
+        insort(self._entries, (weight, melon_number))
+        self._partials = partials
+        
+        return melon_number
+    
+    def remove(self, melon_number):
+        """
+        Remove a melon.
+        
+        Args:
+            melon_number: Number returned by add
+        
+        Raises:
+            KeyError: If there is no such melon in the set
+        """
+        weight = self._weights.pop(melon_number)
+        del self._entries[bisect_left(self._entries, (weight, melon_number))]
+        _add_to_partials(self._partials, -weight)
+    
+    def average(self):
+        """
+        Return the average weight.
+        
+        Raises:
+            ValueError: If the set is empty
+        """
+        if not self._weights:
+            raise ValueError("Must have at least one melon")
+        return math.fsum(self._partials) / len(self._weights)
+    
+    def _first_of_run(self, index):
+        """Return the index of the first entry with the same weight as entries[index]."""
+        return bisect_left(self._entries, (self._entries[index][0],))
+    
+    def perfect_melon(self):
+        """
+        Find the melon closest to the average weight.
+        
+        Returns:
+            Tuple of (melon_number, average_weight)
+        
+        Raises:
+            ValueError: If the set is empty
+        """
+        average_weight = self.average()
+        entries = self._entries
+        
+        # First entry with weight >= average, and the run just below it
+        right = bisect_left(entries, (average_weight,))
+        left = self._first_of_run(right - 1) if right > 0 else None
+        
+        candidates = []
+        if left is not None:
+            candidates.append(left)
+        if right < len(entries):
+            candidates.append(right)
+        
+        best, closest = min((abs(entries[index][0] - average_weight), entries[index][1])
+                            for index in candidates)
+        
+        # Walk outwards over every run of equal weights at the best distance
+        # (distances of different weights can round to the same float); the
+        # first entry of a run has the lowest melon number of that weight
+        numbers = [closest]
+        index = left
+        while index is not None and abs(entries[index][0] - average_weight) == best:
+            numbers.append(entries[index][1])
+            index = self._first_of_run(index - 1) if index > 0 else None
+        
+        index = right
+        while index < len(entries) and abs(entries[index][0] - average_weight) == best:
+            numbers.append(entries[index][1])
+            index = bisect_left(entries, (entries[index][0], math.inf))
+        
+        return min(numbers), average_weight
+
+
 def main():
     """Main function to handle user input and display results."""
     try: